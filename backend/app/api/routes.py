@@ -103,6 +103,34 @@ def predict_yield(request: schemas.PredictionRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/predict/scenarios", response_model=schemas.ScenarioResponse)
+def simulate_scenarios(request: schemas.ScenarioRequest):
+    if not predictor.is_trained:
+        raise HTTPException(status_code=400, detail="Model is not trained yet")
+
+    base = request.base
+    try:
+        result = predictor.simulate_scenarios(
+            crop_type=base.crop_type,
+            field_area=base.field_area,
+            planting_date=base.planting_date,
+            soil_properties=base.soil_properties,
+            weather_data=[data.dict() for data in base.weather_data],
+            perturbations=[p.dict() for p in request.perturbations],
+            sampling=request.sampling,
+            n_samples=request.n_samples,
+            seed=request.seed
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return schemas.ScenarioResponse(
+        **result,
+        prediction_date=datetime.now()
+    )
+
 @router.post("/train/")
 def train_model(db: Session = Depends(get_db)):
     # Get all crops with their weather data
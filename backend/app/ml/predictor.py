@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestRegressor
@@ -6,6 +7,22 @@ import joblib
 from typing import List, Dict
 from datetime import datetime
 
+# Feature columns touched by each scenario perturbation:
+# (level column, spread column or None, whether the level is a sum over readings)
+SCENARIO_COLUMNS = {
+    'temperature': (6, 10, False),
+    'rainfall': (7, 11, True),
+    'humidity': (8, None, False),
+    'soil_moisture': (9, None, False),
+    'ph': (1, None, False),
+    'organic_matter': (2, None, False),
+    'nitrogen': (3, None, False),
+    'phosphorus': (4, None, False),
+    'potassium': (5, None, False),
+}
+
+MAX_SCENARIOS = 100000
+
 class CropYieldPredictor:
     def __init__(self):
         self.model = RandomForestRegressor(
@@ -135,6 +152,118 @@ class CropYieldPredictor:
             }
         }
 
+    def simulate_scenarios(self,
+                           crop_type: str,
+                           field_area: float,
+                           planting_date: datetime,
+                           soil_properties: Dict[str, float],
+                           weather_data: List[Dict],
+                           perturbations: List[Dict],
+                           sampling: str = 'grid',
+                           n_samples: int = 1000,
+                           seed: int = None) -> Dict:
+        """
+        Score a batch of perturbed what-if scenarios around a base input.
+
+        Perturbations are applied directly to the aggregated feature row, so
+        every scenario is built in NumPy and scored in a single forest pass.
+        """
+        if not self.is_trained:
+            raise ValueError("Model needs to be trained before making predictions")
+
+        base = self._prepare_features(
+            crop_type,
+            field_area,
+            planting_date,
+            soil_properties,
+            weather_data
+        )[0]
+        n_readings = len(weather_data)
+
+        lows = np.array([p['low'] for p in perturbations], dtype=float)
+        highs = np.array([p['high'] for p in perturbations], dtype=float)
+
+        # Build the (n_scenarios, n_perturbations) matrix of deltas
+        if sampling == 'grid':
+            n_scenarios = math.prod(p['steps'] for p in perturbations)
+            if n_scenarios > MAX_SCENARIOS:
+                raise ValueError(f"Scenario grid is too large ({n_scenarios} > {MAX_SCENARIOS})")
+            axes = [np.linspace(p['low'], p['high'], p['steps']) for p in perturbations]
+            mesh = np.meshgrid(*axes, indexing='ij')
+            deltas = np.stack([m.ravel() for m in mesh], axis=1)
+        elif sampling == 'monte_carlo':
+            rng = np.random.default_rng(seed)
+            deltas = rng.uniform(lows, highs, size=(n_samples, len(perturbations)))
+        else:
+            raise ValueError(f"Unknown sampling method: {sampling}")
+
+        # One-at-a-time rows at each perturbation's low and high end, plus the
+        # unperturbed base row, are scored in the same pass for sensitivities
+        k = len(perturbations)
+        oat = np.zeros((2 * k, k))
+        oat[np.arange(k), np.arange(k)] = lows
+        oat[k + np.arange(k), np.arange(k)] = highs
+        all_deltas = np.vstack([deltas, oat, np.zeros((1, k))])
+
+        X = np.repeat(base.reshape(1, -1), len(all_deltas), axis=0)
+        varies = np.ptp(deltas, axis=0) > 0
+        for i, p in enumerate(perturbations):
+            level, spread, is_sum = SCENARIO_COLUMNS[p['feature']]
+            delta = all_deltas[:, i]
+            if p['mode'] == 'relative':
+                # Scaling a zero input (e.g. a missing soil nutrient) changes nothing
+                if base[level] == 0 and (spread is None or base[spread] == 0):
+                    varies[i] = False
+                X[:, level] *= 1 + delta
+                if spread is not None:
+                    X[:, spread] *= np.abs(1 + delta)
+            else:
+                X[:, level] += delta * (n_readings if is_sum else 1)
+
+        yields = self.model.predict(self.scaler.transform(X))
+        scenario_yields = yields[:len(deltas)]
+        oat_yields = yields[len(deltas):-1]
+        base_yield = yields[-1]
+
+        # Joint linear fit of yield on the centered deltas gives a per-unit
+        # sensitivity; perturbations that never change the input get no coefficient
+        centered = deltas - deltas.mean(axis=0)
+        coefs = [None] * k
+        if varies.any():
+            fit = np.linalg.lstsq(
+                centered[:, varies],
+                scenario_yields - scenario_yields.mean(),
+                rcond=None
+            )[0]
+            for i, coef in zip(np.flatnonzero(varies), fit):
+                coefs[i] = float(coef)
+
+        percentiles = np.percentile(scenario_yields, [5, 25, 50, 75, 95])
+
+        return {
+            'base_yield': float(base_yield),
+            'n_scenarios': len(deltas),
+            'distribution': {
+                'mean': float(scenario_yields.mean()),
+                'std': float(scenario_yields.std()),
+                'min': float(scenario_yields.min()),
+                'max': float(scenario_yields.max()),
+                'percentiles': {
+                    f'p{q}': float(v) for q, v in zip([5, 25, 50, 75, 95], percentiles)
+                }
+            },
+            'sensitivities': [
+                {
+                    'feature': p['feature'],
+                    'mode': p['mode'],
+                    'yield_per_unit': coefs[i],
+                    'yield_at_low': float(oat_yields[i]),
+                    'yield_at_high': float(oat_yields[k + i])
+                }
+                for i, p in enumerate(perturbations)
+            ]
+        }
+
     def _calculate_confidence_score(self, features_scaled: np.ndarray) -> float:
         """
         Calculate a confidence score for the prediction.
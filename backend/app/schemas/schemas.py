@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from pydantic import BaseModel, Field, conint, conlist, field_validator, model_validator
+from typing import Optional, List, Dict, Literal
 from datetime import datetime
 
 class FarmBase(BaseModel):
@@ -102,4 +102,85 @@ class PredictionResponse(BaseModel):
     confidence_score: float
     prediction_date: datetime
     features_used: Dict[str, float]
-    recommendations: List[str] 
\ No newline at end of file
+    recommendations: List[str] 
+
+class ScenarioPerturbation(BaseModel):
+    feature: Literal[
+        'temperature', 'rainfall', 'humidity', 'soil_moisture',
+        'ph', 'organic_matter', 'nitrogen', 'phosphorus', 'potassium'
+    ]
+    # 'relative' scales the input by (1 + delta), so 0.2 means +20%;
+    # 'absolute' adds delta to every reading
+    mode: Literal['relative', 'absolute'] = 'relative'
+    low: float
+    high: float
+    # Only used by grid sampling
+    steps: conint(ge=1, le=1000) = 5
+
+    @model_validator(mode='after')
+    def check_range(self):
+        if self.low > self.high:
+            raise ValueError("Perturbation low must not exceed high")
+        return self
+
+    @model_validator(mode='after')
+    def check_relative_low(self):
+        # A relative delta of -1 or below would zero or flip the sign of the input
+        if self.mode == 'relative' and self.low <= -1:
+            raise ValueError("Relative perturbations require low > -1")
+        return self
+
+class ScenarioRequest(BaseModel):
+    base: PredictionRequest
+    perturbations: conlist(ScenarioPerturbation, min_length=1, max_length=9)
+    sampling: Literal['grid', 'monte_carlo'] = 'grid'
+    # Only used by Monte Carlo sampling
+    n_samples: conint(gt=0, le=100000) = 1000
+    seed: Optional[int] = None
+
+    @field_validator('perturbations')
+    @classmethod
+    def check_unique_features(cls, perturbations):
+        features = [p.feature for p in perturbations]
+        if len(set(features)) != len(features):
+            raise ValueError("Each feature may only be perturbed once")
+        return perturbations
+
+    @model_validator(mode='after')
+    def check_sampling_options(self):
+        # Options the sampling mode does not use may be sent, but only with their defaults
+        if self.sampling == 'grid':
+            ignored = [
+                name for name in ('n_samples', 'seed')
+                if getattr(self, name) != type(self).model_fields[name].default
+            ]
+            if ignored:
+                raise ValueError(f"Grid sampling does not use {', '.join(ignored)}")
+        else:
+            default_steps = ScenarioPerturbation.model_fields['steps'].default
+            if any(p.steps != default_steps for p in self.perturbations):
+                raise ValueError("Monte Carlo sampling does not use steps")
+        return self
+
+class YieldDistribution(BaseModel):
+    mean: float
+    std: float
+    min: float
+    max: float
+    percentiles: Dict[str, float]
+
+class ScenarioSensitivity(BaseModel):
+    feature: str
+    mode: str
+    # Change in yield per +1.0 of delta: per +100% for relative perturbations,
+    # per unit of the input for absolute ones. None if the input never changed.
+    yield_per_unit: Optional[float] = None
+    yield_at_low: float
+    yield_at_high: float
+
+class ScenarioResponse(BaseModel):
+    base_yield: float
+    n_scenarios: int
+    distribution: YieldDistribution
+    sensitivities: List[ScenarioSensitivity]
+    prediction_date: datetime
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from app.ml.predictor import CropYieldPredictor
+
+PLANTING_DATE = datetime(2024, 4, 1)
+
+
+def make_weather(temperature, rainfall, rng, days=30):
+    return [
+        {
+            'date': PLANTING_DATE + timedelta(days=i),
+            'temperature': temperature + rng.normal(),
+            'humidity': 60.0,
+            'rainfall': max(0.0, rainfall + rng.normal()),
+            'soil_moisture': 0.3
+        }
+        for i in range(days)
+    ]
+
+
+@pytest.fixture(scope="session")
+def trained_predictor():
+    rng = np.random.default_rng(0)
+    training_data = []
+    for _ in range(100):
+        temperature = rng.uniform(15, 35)
+        rainfall = rng.uniform(0, 10)
+        ph = rng.uniform(5, 8)
+        training_data.append({
+            'crop_type': 'corn',
+            'field_area': 10.0,
+            'planting_date': PLANTING_DATE,
+            'soil_properties': {'ph': ph, 'nitrogen': 20.0},
+            'weather_data': make_weather(temperature, rainfall, rng),
+            'actual_yield': 5 + 0.3 * rainfall - 0.1 * abs(temperature - 25) - abs(ph - 6.5)
+        })
+
+    predictor = CropYieldPredictor()
+    predictor.train(training_data)
+    return predictor
+
+
+@pytest.fixture
+def base_request():
+    return {
+        'crop_type': 'corn',
+        'field_area': 10.0,
+        'planting_date': PLANTING_DATE,
+        'soil_type': 'loam',
+        'soil_properties': {'ph': 6.5, 'nitrogen': 20.0},
+        'weather_data': make_weather(25, 5, np.random.default_rng(1))
+    }
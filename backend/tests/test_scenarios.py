@@ -0,0 +1,208 @@
+import os
+import time
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api import routes
+from app.ml.predictor import CropYieldPredictor
+
+
+class IdentityScaler:
+    def transform(self, X):
+        return X
+
+
+class RecordingModel:
+    """Stands in for the forest and keeps the rows it was asked to score."""
+
+    def predict(self, X):
+        self.X = X.copy()
+        return X.sum(axis=1)
+
+
+def simulate(predictor, base_request, perturbations, **kwargs):
+    return predictor.simulate_scenarios(
+        crop_type=base_request['crop_type'],
+        field_area=base_request['field_area'],
+        planting_date=base_request['planting_date'],
+        soil_properties=base_request['soil_properties'],
+        weather_data=base_request['weather_data'],
+        perturbations=perturbations,
+        **kwargs
+    )
+
+
+def to_json(base_request):
+    return {
+        **base_request,
+        'planting_date': base_request['planting_date'].isoformat(),
+        'weather_data': [{**w, 'date': w['date'].isoformat()}
+                         for w in base_request['weather_data']]
+    }
+
+
+def perturbation(feature, low, high, mode='relative', steps=5):
+    return {'feature': feature, 'mode': mode, 'low': low, 'high': high, 'steps': steps}
+
+
+@pytest.fixture
+def recording_predictor():
+    predictor = CropYieldPredictor()
+    predictor.model = RecordingModel()
+    predictor.scaler = IdentityScaler()
+    predictor.is_trained = True
+    return predictor
+
+
+@pytest.fixture
+def client(trained_predictor, monkeypatch):
+    monkeypatch.setattr(routes, "predictor", trained_predictor)
+    app = FastAPI()
+    app.include_router(routes.router)
+    return TestClient(app)
+
+
+def test_grid_size_and_shape(recording_predictor, base_request):
+    result = simulate(recording_predictor, base_request, [
+        perturbation('rainfall', -0.2, 0.2, steps=4),
+        perturbation('temperature', -2, 2, mode='absolute', steps=3)
+    ])
+
+    assert result['n_scenarios'] == 12
+    # Grid rows, two one-at-a-time rows per perturbation and the base row
+    assert recording_predictor.model.X.shape == (12 + 4 + 1, 12)
+    assert len(result['sensitivities']) == 2
+
+
+def test_monte_carlo_is_reproducible_with_seed(trained_predictor, base_request):
+    perturbations = [perturbation('rainfall', -0.3, 0.3)]
+    first = simulate(trained_predictor, base_request, perturbations,
+                     sampling='monte_carlo', n_samples=500, seed=7)
+    second = simulate(trained_predictor, base_request, perturbations,
+                      sampling='monte_carlo', n_samples=500, seed=7)
+
+    assert first['n_scenarios'] == 500
+    assert first['distribution'] == second['distribution']
+    assert first['sensitivities'] == second['sensitivities']
+
+
+def test_relative_mode_scales_mean_and_spread(recording_predictor, base_request):
+    simulate(recording_predictor, base_request, [
+        perturbation('temperature', 0.1, 0.1, steps=1)
+    ])
+    X = recording_predictor.model.X
+    base, scenario = X[-1], X[0]
+
+    assert scenario[6] == pytest.approx(base[6] * 1.1)
+    assert scenario[10] == pytest.approx(base[10] * 1.1)
+
+
+def test_absolute_mode_adds_to_rainfall_total(recording_predictor, base_request):
+    n_readings = len(base_request['weather_data'])
+    simulate(recording_predictor, base_request, [
+        perturbation('rainfall', 2.0, 2.0, mode='absolute', steps=1)
+    ])
+    X = recording_predictor.model.X
+    base, scenario = X[-1], X[0]
+
+    assert scenario[7] == pytest.approx(base[7] + n_readings * 2.0)
+    assert scenario[11] == pytest.approx(base[11])
+
+
+def test_constant_perturbation_has_no_sensitivity(trained_predictor, base_request):
+    result = simulate(trained_predictor, base_request, [
+        perturbation('rainfall', 0.1, 0.1, steps=1),
+        perturbation('temperature', -2, 2, mode='absolute', steps=5)
+    ])
+    rainfall, temperature = result['sensitivities']
+
+    assert rainfall['yield_per_unit'] is None
+    assert rainfall['yield_at_low'] == rainfall['yield_at_high']
+    assert temperature['yield_per_unit'] is not None
+
+
+def test_relative_perturbation_of_zero_input_has_no_sensitivity(trained_predictor, base_request):
+    # base_request has no potassium, so it defaults to 0
+    result = simulate(trained_predictor, base_request, [
+        perturbation('potassium', -0.5, 0.5),
+        perturbation('rainfall', -0.2, 0.2)
+    ])
+    potassium, rainfall = result['sensitivities']
+
+    assert potassium['yield_per_unit'] is None
+    assert rainfall['yield_per_unit'] is not None
+
+
+def test_scenarios_endpoint(client, base_request):
+    response = client.post("/predict/scenarios", json={
+        'base': to_json(base_request),
+        'perturbations': [perturbation('rainfall', -0.2, 0.2)]
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body['n_scenarios'] == 5
+    assert set(body['distribution']['percentiles']) == {'p5', 'p25', 'p50', 'p75', 'p95'}
+
+
+@pytest.mark.parametrize("perturbations, status_code", [
+    ([perturbation('rainfall', 0.2, -0.2)], 422),
+    ([perturbation('rainfall', -0.2, 0.2, steps=1000),
+      perturbation('temperature', -2, 2, mode='absolute', steps=1000)], 400),
+])
+def test_scenarios_endpoint_rejects_bad_requests(client, base_request, perturbations, status_code):
+    response = client.post("/predict/scenarios", json={
+        'base': to_json(base_request),
+        'perturbations': perturbations
+    })
+
+    assert response.status_code == status_code
+
+
+@pytest.mark.parametrize("options, status_code", [
+    ({'n_samples': 1000, 'seed': None}, 200),
+    ({'n_samples': 500}, 422),
+    ({'seed': 3}, 422),
+])
+def test_scenarios_endpoint_grid_sampling_options(client, base_request, options, status_code):
+    response = client.post("/predict/scenarios", json={
+        'base': to_json(base_request),
+        'perturbations': [perturbation('rainfall', -0.2, 0.2)],
+        'sampling': 'grid',
+        **options
+    })
+
+    assert response.status_code == status_code
+
+
+def test_scenarios_endpoint_requires_trained_model(client, base_request, monkeypatch):
+    monkeypatch.setattr(routes, "predictor", CropYieldPredictor())
+    response = client.post("/predict/scenarios", json={
+        'base': to_json(base_request),
+        'perturbations': [perturbation('rainfall', -0.2, 0.2)]
+    })
+
+    assert response.status_code == 400
+    assert response.json()['detail'] == "Model is not trained yet"
+
+
+TEN_THOUSAND_SCENARIOS = [
+    perturbation('rainfall', -0.3, 0.3, steps=100),
+    perturbation('temperature', -2, 2, mode='absolute', steps=100)
+]
+
+
+def test_ten_thousand_scenarios(trained_predictor, base_request):
+    result = simulate(trained_predictor, base_request, TEN_THOUSAND_SCENARIOS)
+
+    assert result['n_scenarios'] == 10000
+
+
+@pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run timing checks")
+def test_ten_thousand_scenarios_under_a_second(trained_predictor, base_request):
+    start = time.perf_counter()
+    simulate(trained_predictor, base_request, TEN_THOUSAND_SCENARIOS)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0